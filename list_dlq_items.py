@@ -1,12 +1,19 @@
 import argparse
+import contextlib
 import json
 import logging
 import os
+import sys
+from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, reduce
+from itertools import compress
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from dotenv import load_dotenv
 
 from config_utils import ConfigManager
@@ -14,28 +21,78 @@ from config_utils import ConfigManager
 # Carrega variáveis de ambiente do arquivo .env
 load_dotenv()
 
-# Configuração da sessão AWS usando variáveis de ambiente
-session = boto3.Session(
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-    region_name=os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
-)
+logger = logging.getLogger(__name__)
 
-sqs = session.client("sqs")
 
-# Inicializar gerenciador de configuração
-config_manager = ConfigManager()
+def _max_workers() -> int:
+    """Número de workers compartilhado entre o pool de threads e o de conexões"""
+    return int(os.getenv("DLQ_MAX_WORKERS", "16"))
 
-# Obter lista de DLQs usando o utilitário de configuração
-dlq_list = config_manager.sqs_config.get_dlq_list()
 
-# Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler('dlq_items_filtering.log'), logging.StreamHandler()],
-)
-logger = logging.getLogger(__name__)
+@lru_cache(maxsize=1)
+def get_sqs_client():
+    """Cria (uma única vez) o cliente SQS usando variáveis de ambiente"""
+    session = boto3.Session(
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=os.getenv("AWS_DEFAULT_REGION", "us-east-1"),
+    )
+    # Pool de conexões dimensionado para o pool de threads compartilhado,
+    # senão buscas paralelas acima de 10 filas descartam e reabrem conexões TLS
+    client_config = Config(
+        max_pool_connections=_max_workers(),
+        tcp_keepalive=True,
+    )
+    return session.client("sqs", config=client_config)
+
+
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Cria (uma única vez) o gerenciador de configuração"""
+    return ConfigManager()
+
+
+@lru_cache(maxsize=1)
+def get_dlq_list() -> tuple[tuple[str, str], ...]:
+    """Obtém (uma única vez) a lista de DLQs do utilitário de configuração"""
+    return tuple(get_config_manager().sqs_config.get_dlq_list())
+
+
+def _setup_logging() -> None:
+    """Configura logging em arquivo+console apenas na execução como script"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler('dlq_items_filtering.log'),
+                logging.StreamHandler(),
+            ],
+        )
+
+
+def _typed_targets(target: str) -> tuple[str, int | None]:
+    """
+    Pré-calcula as variantes tipadas de um valor alvo de filtro
+
+    Returns:
+        Tupla (valor_str, valor_int ou None) para comparação direta sem str()
+    """
+    try:
+        return target, int(target)
+    except (ValueError, TypeError):
+        return target, None
+
+
+def prompt_or_default(prompt: str, default: str = "") -> str:
+    """
+    Lê entrada do usuário, ou retorna o valor padrão quando stdin não é um terminal
+
+    Evita que execuções via pipe/CI fiquem bloqueadas aguardando entrada.
+    """
+    if not sys.stdin.isatty():
+        return default
+    return input(prompt)
 
 
 class FilterCriteria:
@@ -44,6 +101,7 @@ class FilterCriteria:
     def __init__(self):
         self.filters: list[Callable[[dict[str, Any]], bool]] = []
         self.filter_descriptions: list[str] = []
+        self._combined: Callable[[dict[str, Any]], bool] | None = None
 
     def add_filter(
         self, filter_func: Callable[[dict[str, Any]], bool], description: str
@@ -51,36 +109,37 @@ class FilterCriteria:
         """Adiciona um filtro com sua descrição"""
         self.filters.append(filter_func)
         self.filter_descriptions.append(description)
+        # Pré-combina os filtros em um único predicado; o "and" curto-circuita
+        # no primeiro filtro reprovado
+        self._combined = reduce(lambda f, g: lambda m: f(m) and g(m), self.filters)
 
     def apply_filters(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Aplica todos os filtros às mensagens"""
-        if not self.filters:
+        if self._combined is None:
             return messages
 
-        filtered_messages = []
-        for message in messages:
-            passes_all_filters = True
-            for filter_func in self.filters:
-                if not filter_func(message):
-                    passes_all_filters = False
-                    break
-
-            if passes_all_filters:
-                filtered_messages.append(message)
-
-        return filtered_messages
+        # map + compress percorrem a lista em velocidade de C, em vez do
+        # duplo loop Python mensagem × filtro
+        return list(compress(messages, map(self._combined, messages)))
 
 
 class DLQItemsLister:
     """Classe aprimorada para listar itens das Dead Letter Queues com filtragem avançada"""
 
     def __init__(self):
-        self.sqs = sqs
-        self.dlq_list = dlq_list
+        self.sqs = get_sqs_client()
+        self.dlq_list = get_dlq_list()
         self.filter_criteria = FilterCriteria()
         self.selected_queues: list[str] | None = None
         self.max_messages_per_queue = 10
         self.filtered_results: dict[str, list[dict[str, Any]]] = {}
+        # Pool único compartilhado por toda a execução (evita pools aninhados
+        # criados por chamada, que desperdiçam threads e sessões TLS)
+        self._pool = ThreadPoolExecutor(max_workers=_max_workers())
+
+    def close(self) -> None:
+        """Encerra o pool de threads compartilhado"""
+        self._pool.shutdown(wait=True)
 
     def select_queues_interactively(self) -> list[str]:
         """
@@ -98,7 +157,7 @@ class DLQItemsLister:
         print(f"  {len(self.dlq_list) + 1}. Todas as filas")
 
         try:
-            selection = input(
+            selection = prompt_or_default(
                 "\n🔸 Selecione as filas (números separados por vírgula): "
             ).strip()
 
@@ -135,7 +194,7 @@ class DLQItemsLister:
         print("(Padrão: 10, mínimo: 1, máximo: 100)")
 
         try:
-            max_messages = input(
+            max_messages = prompt_or_default(
                 "🔸 Digite o número máximo de mensagens por fila: "
             ).strip()
 
@@ -170,7 +229,7 @@ class DLQItemsLister:
         print("4. Mensagens por período de tempo")
         print("5. Pular configuração de filtros")
 
-        filter_choice = input("\n🔸 Escolha um filtro (1-5): ").strip()
+        filter_choice = prompt_or_default("\n🔸 Escolha um filtro (1-5): ").strip()
 
         if filter_choice == "1":
             self._setup_empty_description_filter()
@@ -200,14 +259,19 @@ class DLQItemsLister:
 
     def _setup_specific_id_filter(self):
         """Configura filtro para IDs específicos"""
-        target_id = input("🔸 Digite o ID que deseja filtrar: ").strip()
+        target_id = prompt_or_default("🔸 Digite o ID que deseja filtrar: ").strip()
+        target_str, target_int = _typed_targets(target_id)
 
         def specific_id_filter(message: dict[str, Any]) -> bool:
             body = message.get('body', {})
             if isinstance(body, dict):
-                # Procura em vários campos possíveis de ID
+                # Procura em vários campos possíveis de ID, comparando pelos
+                # tipos esperados em vez de stringificar cada valor
                 for field in ['id', 'messageId', 'requestId', 'userId', 'itemId']:
-                    if str(body.get(field, '')) == target_id:
+                    value = body.get(field)
+                    if value == target_str or (
+                        target_int is not None and value == target_int
+                    ):
                         return True
             return False
 
@@ -218,14 +282,18 @@ class DLQItemsLister:
 
     def _setup_custom_field_filter(self):
         """Configura filtro para campo customizado"""
-        field_name = input("🔸 Digite o nome do campo: ").strip()
-        field_value = input("🔸 Digite o valor do campo: ").strip()
+        field_name = prompt_or_default("🔸 Digite o nome do campo: ").strip()
+        field_value = prompt_or_default("🔸 Digite o valor do campo: ").strip()
+        target_str, target_int = _typed_targets(field_value)
 
         def custom_field_filter(message: dict[str, Any]) -> bool:
             body = message.get('body', {})
-            if isinstance(body, dict):
-                return str(body.get(field_name, '')) == field_value
-            return False
+            if not isinstance(body, dict):
+                return False
+            value = body.get(field_name)
+            return value == target_str or (
+                target_int is not None and value == target_int
+            )
 
         self.filter_criteria.add_filter(
             custom_field_filter,
@@ -238,8 +306,8 @@ class DLQItemsLister:
         print("🕒 Filtro por período de tempo")
         print("Formato: YYYY-MM-DD HH:MM (exemplo: 2024-01-15 14:30)")
 
-        start_time = input("🔸 Data/hora inicial (deixe vazio para ignorar): ").strip()
-        end_time = input("🔸 Data/hora final (deixe vazio para ignorar): ").strip()
+        start_time = prompt_or_default("🔸 Data/hora inicial (deixe vazio para ignorar): ").strip()
+        end_time = prompt_or_default("🔸 Data/hora final (deixe vazio para ignorar): ").strip()
 
         start_dt = None
         end_dt = None
@@ -253,27 +321,27 @@ class DLQItemsLister:
             print("❌ Formato de data inválido. Filtro de tempo não será aplicado.")
             return
 
-        def time_period_filter(message: dict[str, Any]) -> bool:
-            try:
-                # Tenta obter timestamp da mensagem dos atributos
-                attributes = message.get('attributes', {})
-                sent_timestamp = attributes.get('SentTimestamp')
-
-                if not sent_timestamp:
-                    return True  # Se não há timestamp, passa o filtro
+        # Pré-calcula os limites em milissegundos: a comparação por mensagem vira
+        # uma comparação de inteiros, sem construir datetime no hot path
+        start_ms = int(start_dt.timestamp() * 1000) if start_dt else None
+        end_ms = int(end_dt.timestamp() * 1000) if end_dt else None
 
-                # Converte timestamp Unix para datetime
-                msg_time = datetime.fromtimestamp(int(sent_timestamp) / 1000)
+        def time_period_filter(message: dict[str, Any]) -> bool:
+            # Tenta obter timestamp da mensagem dos atributos
+            sent_timestamp = message.get('attributes', {}).get('SentTimestamp')
 
-                if start_dt and msg_time < start_dt:
-                    return False
-                if end_dt and msg_time > end_dt:
-                    return False
+            if not sent_timestamp:
+                return True  # Se não há timestamp, passa o filtro
 
-                return True
-            except (ValueError, TypeError, KeyError):
+            try:
+                ts_ms = int(sent_timestamp)
+            except (ValueError, TypeError):
                 return True  # Em caso de erro, passa o filtro
 
+            return (start_ms is None or ts_ms >= start_ms) and (
+                end_ms is None or ts_ms <= end_ms
+            )
+
         description = f"Mensagens entre {start_time or 'início'} e {end_time or 'fim'}"
         self.filter_criteria.add_filter(time_period_filter, description)
         print(f"✅ Filtro de período configurado: {description}")
@@ -349,8 +417,8 @@ class DLQItemsLister:
         return {
             'queue_name': queue_name,
             'message_id': message.get('MessageId', 'N/A'),
-            'receipt_handle': message.get('ReceiptHandle', 'N/A')[:50]
-            + '...',  # Trunca para exibição
+            # Mantém o handle completo (necessário para redrive); truncar apenas na exibição
+            'receipt_handle': message.get('ReceiptHandle', 'N/A'),
             'body': body,
             'attributes': message.get('Attributes', {}),
             'message_attributes': message.get('MessageAttributes', {}),
@@ -575,7 +643,7 @@ class DLQItemsLister:
 
         # Procurar nas filas normais também (caso seja especificada)
         try:
-            all_queues = config_manager.sqs_config.get_all_queues()
+            all_queues = get_config_manager().sqs_config.get_all_queues()
             for queue_name, queue_url in all_queues:
                 if queue_name.lower() == queue_name_or_url.lower():
                     return queue_url
@@ -625,46 +693,68 @@ class DLQItemsLister:
         else:
             print("📝 Nenhum filtro aplicado")
 
-        # Filtra apenas as filas selecionadas
+        # Filtra apenas as filas selecionadas (set para membership O(1))
+        selected_set = set(selected_queues)
         selected_dlqs = [
-            (name, url) for name, url in self.dlq_list if name in selected_queues
+            (name, url) for name, url in self.dlq_list if name in selected_set
         ]
 
-        for queue_name, queue_url in selected_dlqs:
-            print(f"\n📋 Processando: {queue_name.upper()}")
-            print("-" * 40)
+        # Fase 1: buscar as mensagens de todas as filas selecionadas em paralelo,
+        # usando o pool compartilhado da instância
+        fetches = {
+            queue_name: self._pool.submit(
+                self.get_messages_from_queue, queue_url, max_messages_per_queue
+            )
+            for queue_name, queue_url in selected_dlqs
+        }
+
+        print(f"\n🔄 Buscando mensagens de {len(fetches)} fila(s)...")
 
-            messages = self.get_messages_from_queue(queue_url, max_messages_per_queue)
+        raw_by_queue: dict[str, list[dict[str, Any]]] = {}
+        for queue_name, future in fetches.items():
+            messages = future.result()
             total_retrieved += len(messages)
+            raw_by_queue[queue_name] = messages
+
+        # Fase 2: formatar e filtrar todas as mensagens em um único lote,
+        # em vez de intercalar fetch/format/filter fila a fila
+        formatted_flat = [
+            self.format_message(message, queue_name)
+            for queue_name, messages in raw_by_queue.items()
+            for message in messages
+        ]
 
-            if not messages:
-                print("✅ Nenhuma mensagem encontrada")
+        if self.filter_criteria.filters:
+            filtered_flat = self.filter_criteria.apply_filters(formatted_flat)
+        else:
+            filtered_flat = formatted_flat
+
+        total_after_filter = len(filtered_flat)
+
+        # Fase 3: reagrupar por fila para exibição e retorno
+        grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for msg in filtered_flat:
+            grouped[msg['queue_name']].append(msg)
+
+        for queue_name, raw_messages in raw_by_queue.items():
+            filtered_messages = grouped.get(queue_name, [])
+
+            if not raw_messages:
+                print(f"\n✅ Nenhuma mensagem encontrada em {queue_name}")
                 all_messages[queue_name] = []
                 continue
 
-            # Formatar mensagens
-            formatted_messages = []
-            for message in messages:
-                formatted_msg = self.format_message(message, queue_name)
-                formatted_messages.append(formatted_msg)
-
-            # Aplicar filtros
+            print(f"\n📋 {queue_name.upper()}")
             if self.filter_criteria.filters:
-                filtered_messages = self.filter_criteria.apply_filters(
-                    formatted_messages
-                )
-                print(f"  📊 Mensagens recuperadas: {len(formatted_messages)}")
+                print(f"  📊 Mensagens recuperadas: {len(raw_messages)}")
                 print(f"  🔍 Após filtros: {len(filtered_messages)}")
 
                 logger.info(
-                    f"Fila {queue_name}: {len(formatted_messages)} -> {len(filtered_messages)} após filtros"
+                    f"Fila {queue_name}: {len(raw_messages)} -> {len(filtered_messages)} após filtros"
                 )
             else:
-                filtered_messages = formatted_messages
                 print(f"  📊 Total: {len(filtered_messages)} mensagens")
 
-            total_after_filter += len(filtered_messages)
-
             # Exibir IDs das mensagens filtradas
             for i, msg in enumerate(filtered_messages, 1):
                 print(f"  📨 Mensagem {i}: {msg['message_id']}")
@@ -713,14 +803,17 @@ class DLQItemsLister:
             print("❌ Nenhum resultado filtrado disponível para salvar")
             return ""
 
+        # Um único now() para nome de arquivo e metadados (evita timestamps inconsistentes)
+        now = datetime.now()
+
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"dlq_filtered_items_{timestamp}.json"
 
         # Criar dados com metadados
         export_data = {
             "metadata": {
-                "export_timestamp": datetime.now().isoformat(),
+                "export_timestamp": now.isoformat(),
                 "filters_applied": self.filter_criteria.filter_descriptions,
                 "total_queues": len(self.filtered_results),
                 "selected_queues": list(self.filtered_results.keys()),
@@ -841,7 +934,7 @@ class DLQItemsLister:
             print("2. Salvar dados brutos")
             print("3. Não salvar")
 
-            save_option = input("\n🔸 Escolha uma opção (1-3): ").strip()
+            save_option = prompt_or_default("\n🔸 Escolha uma opção (1-3): ").strip()
 
             if save_option == "1":
                 filename = self.save_filtered_results_to_json()
@@ -864,13 +957,13 @@ class DLQItemsLister:
         print("=" * 60)
 
         # 1. Solicitar campo a ser verificado
-        field_name = input("🔸 Digite o nome do campo JSON a verificar: ").strip()
+        field_name = prompt_or_default("🔸 Digite o nome do campo JSON a verificar: ").strip()
         if not field_name:
             print("❌ Campo é obrigatório.")
             return
 
         # 2. Solicitar valor esperado
-        field_value = input(
+        field_value = prompt_or_default(
             f"🔸 Digite o valor esperado para o campo '{field_name}': "
         ).strip()
         if not field_value:
@@ -886,7 +979,7 @@ class DLQItemsLister:
         print("(Digite 0 para processar todas as mensagens disponíveis)")
 
         try:
-            max_input = input(
+            max_input = prompt_or_default(
                 "🔸 Número máximo de mensagens a processar (padrão: 0): "
             ).strip()
             max_messages = int(max_input) if max_input else 0
@@ -944,10 +1037,10 @@ def count_messages_by_field_standalone(
         print(f"Encontradas {count} mensagens com table_code=HM")
     """
     try:
-        lister = DLQItemsLister()
-        return lister.count_messages_by_field(
-            queue_name, field_name, field_value, max_messages
-        )
+        with contextlib.closing(DLQItemsLister()) as lister:
+            return lister.count_messages_by_field(
+                queue_name, field_name, field_value, max_messages
+            )
     except Exception as e:
         logger.error(f"Erro na contagem standalone: {e}")
         print(f"❌ Erro durante contagem: {str(e)}")
@@ -1025,139 +1118,162 @@ def parse_cli_arguments():
 
 def main():
     """Função principal com suporte a CLI e modo interativo"""
+    _setup_logging()
     args = parse_cli_arguments()
 
     try:
-        lister = DLQItemsLister()
-
-        # Modo contagem de mensagens por campo-valor
-        if args.count:
-            # Se --field e --value não foram fornecidos, entrar em modo interativo
-            if not args.field or not args.value:
-                print("🔢 Modo contagem ativo - Iniciando modo interativo")
-                lister.run_interactive_count_mode()
-                return
-
-            # Determinar limite de mensagens
-            max_messages = None if args.max_messages == 0 else args.max_messages
-
-            # Determinar filas a processar
-            if args.queue:
-                # Fila específica
-                print(f"🎯 Modo Contagem - Fila específica: {args.queue}")
-                count = lister.count_messages_by_field(
-                    args.queue, args.field, args.value, max_messages
-                )
-                print(f"\n🎉 RESULTADO FINAL: {count} mensagens encontradas")
-            else:
-                # Todas as DLQs
-                print("🎯 Modo Contagem - Todas as DLQs")
-                total_count = 0
-
-                for queue_name, _ in lister.dlq_list:
-                    print(f"\n{'='*60}")
+        with contextlib.closing(DLQItemsLister()) as lister:
+
+            # Modo contagem de mensagens por campo-valor
+            if args.count:
+                # Se --field e --value não foram fornecidos, entrar em modo interativo
+                if not args.field or not args.value:
+                    print("🔢 Modo contagem ativo - Iniciando modo interativo")
+                    lister.run_interactive_count_mode()
+                    return
+
+                # Determinar limite de mensagens
+                max_messages = None if args.max_messages == 0 else args.max_messages
+
+                # Determinar filas a processar
+                if args.queue:
+                    # Fila específica
+                    print(f"🎯 Modo Contagem - Fila específica: {args.queue}")
                     count = lister.count_messages_by_field(
-                        queue_name, args.field, args.value, max_messages
+                        args.queue, args.field, args.value, max_messages
                     )
-                    total_count += count
-                    print(f"✅ {queue_name}: {count} mensagens")
-
-                print(
-                    f"\n🎉 RESULTADO FINAL: {total_count} mensagens encontradas em todas as DLQs"
-                )
+                    print(f"\n🎉 RESULTADO FINAL: {count} mensagens encontradas")
+                else:
+                    # Todas as DLQs
+                    print("🎯 Modo Contagem - Todas as DLQs")
+                    total_count = 0
+
+                    for queue_name, _ in lister.dlq_list:
+                        print(f"\n{'='*60}")
+                        count = lister.count_messages_by_field(
+                            queue_name, args.field, args.value, max_messages
+                        )
+                        total_count += count
+                        print(f"✅ {queue_name}: {count} mensagens")
 
-            return
+                    print(
+                        f"\n🎉 RESULTADO FINAL: {total_count} mensagens encontradas em todas as DLQs"
+                    )
 
-        if args.interactive:
-            # Modo interativo
-            lister.run_interactive_mode()
-        else:
-            # Modo CLI tradicional (listagem/filtragem)
-            print("🚀 Iniciando listagem de itens das DLQs...")
+                return
 
-            # Configurar parâmetros do CLI
-            max_messages = args.max_messages
-            selected_queues = None
+            if args.interactive:
+                # Modo interativo
+                lister.run_interactive_mode()
+            else:
+                # Modo CLI tradicional (listagem/filtragem)
+                print("🚀 Iniciando listagem de itens das DLQs...")
 
-            if args.queues:
-                selected_queues = [q.strip() for q in args.queues.split(',')]
+                # Configurar parâmetros do CLI
+                max_messages = args.max_messages
+                selected_queues = None
 
-            # Configurar filtros do CLI
-            if args.filter_empty_description:
+                if args.queues:
+                    selected_queues = [q.strip() for q in args.queues.split(',')]
 
-                def empty_desc_filter(message: dict[str, Any]) -> bool:
-                    body = message.get('body', {})
-                    if isinstance(body, dict):
-                        description = body.get('description', '')
-                        return description == '' or description is None
-                    return False
+                # Configurar filtros do CLI
+                if args.filter_empty_description:
 
-                lister.filter_criteria.add_filter(
-                    empty_desc_filter, "Mensagens com campo 'description' vazio (CLI)"
-                )
+                    def empty_desc_filter(message: dict[str, Any]) -> bool:
+                        body = message.get('body', {})
+                        if isinstance(body, dict):
+                            description = body.get('description', '')
+                            return description == '' or description is None
+                        return False
 
-            if args.filter_id:
-
-                def id_filter(message: dict[str, Any]) -> bool:
-                    body = message.get('body', {})
-                    if isinstance(body, dict):
-                        for field in [
-                            'id',
-                            'messageId',
-                            'requestId',
-                            'userId',
-                            'itemId',
-                        ]:
-                            if str(body.get(field, '')) == args.filter_id:
-                                return True
-                    return False
-
-                lister.filter_criteria.add_filter(
-                    id_filter, f"Mensagens com ID '{args.filter_id}' (CLI)"
-                )
+                    lister.filter_criteria.add_filter(
+                        empty_desc_filter, "Mensagens com campo 'description' vazio (CLI)"
+                    )
 
-            if args.filter_field:
-                try:
-                    field_name, field_value = args.filter_field.split(':', 1)
+                if args.filter_id:
+                    id_str, id_int = _typed_targets(args.filter_id)
 
-                    def field_filter(message: dict[str, Any]) -> bool:
+                    def id_filter(message: dict[str, Any]) -> bool:
                         body = message.get('body', {})
                         if isinstance(body, dict):
-                            return str(body.get(field_name, '')) == field_value
+                            for field in [
+                                'id',
+                                'messageId',
+                                'requestId',
+                                'userId',
+                                'itemId',
+                            ]:
+                                value = body.get(field)
+                                if value == id_str or (
+                                    id_int is not None and value == id_int
+                                ):
+                                    return True
                         return False
 
                     lister.filter_criteria.add_filter(
-                        field_filter,
-                        f"Mensagens onde '{field_name}' = '{field_value}' (CLI)",
+                        id_filter, f"Mensagens com ID '{args.filter_id}' (CLI)"
                     )
-                except ValueError:
-                    print("❌ Formato de filtro de campo inválido. Use 'campo:valor'")
-
-            # Executar listagem
-            dlq_data = lister.list_dlq_items_with_filters(max_messages, selected_queues)
 
-            # Exibir resumo
-            lister.print_summary(dlq_data)
+                if args.filter_field:
+                    try:
+                        field_name, field_value = args.filter_field.split(':', 1)
+                        value_str, value_int = _typed_targets(field_value)
+
+                        def field_filter(message: dict[str, Any]) -> bool:
+                            body = message.get('body', {})
+                            if not isinstance(body, dict):
+                                return False
+                            value = body.get(field_name)
+                            return value == value_str or (
+                                value_int is not None and value == value_int
+                            )
 
-            # Salvar se solicitado
-            if args.save_filtered:
-                filename = lister.save_filtered_results_to_json()
-                if filename:
-                    print("✅ Resultados filtrados salvos automaticamente!")
-            else:
-                # Modo legado - pergunta se deseja salvar
-                save_option = (
-                    input("\n💾 Deseja salvar os dados em arquivo JSON? (s/n): ")
-                    .lower()
-                    .strip()
+                        lister.filter_criteria.add_filter(
+                            field_filter,
+                            f"Mensagens onde '{field_name}' = '{field_value}' (CLI)",
+                        )
+                    except ValueError:
+                        print("❌ Formato de filtro de campo inválido. Use 'campo:valor'")
+
+                # Executar listagem
+                dlq_data = lister.list_dlq_items_with_filters(max_messages, selected_queues)
+
+                # Exibir resumo
+                lister.print_summary(dlq_data)
+
+                # Quando qualquer flag CLI foi usada, a execução é não-interativa:
+                # não faz sentido parar no prompt legado de salvamento
+                non_interactive = any(
+                    [
+                        args.save_filtered,
+                        args.filter_id,
+                        args.filter_field,
+                        args.filter_empty_description,
+                        args.queues,
+                    ]
                 )
 
-                if save_option in ['s', 'sim', 'y', 'yes']:
-                    filename = lister.save_to_json(dlq_data)
+                # Salvar se solicitado
+                if args.save_filtered:
+                    filename = lister.save_filtered_results_to_json()
                     if filename:
-                        print("✅ Arquivo salvo com sucesso!")
+                        print("✅ Resultados filtrados salvos automaticamente!")
+                elif not non_interactive:
+                    # Modo legado - pergunta se deseja salvar
+                    save_option = (
+                        prompt_or_default(
+                            "\n💾 Deseja salvar os dados em arquivo JSON? (s/n): ", "n"
+                        )
+                        .lower()
+                        .strip()
+                    )
+
+                    if save_option in ['s', 'sim', 'y', 'yes']:
+                        filename = lister.save_to_json(dlq_data)
+                        if filename:
+                            print("✅ Arquivo salvo com sucesso!")
 
-        print("\n✨ Listagem concluída!")
+            print("\n✨ Listagem concluída!")
 
     except KeyboardInterrupt:
         print("\n\n👋 Operação interrompida pelo usuário.")
@@ -5,18 +5,124 @@ Fornece informações detalhadas sobre configuração, runtime, tamanho e últim
 """
 
 import argparse
+import io
 import json
 import os
+import queue
+import subprocess
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
+from functools import cache
+from operator import attrgetter
 from typing import Any
 
-import boto3
-from dotenv import load_dotenv
-
 from config_utils import ConfigManager
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # Dependência opcional: cai no json da stdlib
+    orjson = None
+
+@cache
+def _get_session(region: str):
+    """Sessão boto3 em cache por região, reutilizada entre instâncias"""
+    # Import tardio: boto3 leva centenas de ms para importar e não é
+    # necessário em caminhos como --help ou erro de argparse
+    import boto3
+
+    # A região vem explícita do chamador (o padrão do CLI já considera
+    # AWS_DEFAULT_REGION); assim cada sessão multi-região aponta certo
+    return boto3.Session(
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=region,
+    )
+
+
+@cache
+def _get_lambda_client(region: str):
+    """Cliente Lambda em cache por região"""
+    from botocore.config import Config
+
+    # Keepalive evita refazer handshake TLS a cada request e o pool maior
+    # acompanha o fan-out do ThreadPoolExecutor em list_all_functions
+    config = Config(
+        tcp_keepalive=True,
+        max_pool_connections=16,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+    )
+    return _get_session(region).client('lambda', config=config)
+
+
+def _parse_last_modified(value: str) -> int | None:
+    """Converte o LastModified ISO da API em epoch (segundos), ou None"""
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class FunctionInfo:
+    """
+    Registro compacto de uma função Lambda
+
+    Campos de detalhe ficam como None quando a coleta é feita em modo básico;
+    __slots__ reduz o custo de memória por registro frente a um dict por função.
+    """
+
+    function_name: str
+    runtime: str = 'N/A'
+    handler: str = 'N/A'
+    code_size: int = 0
+    code_size_mb: float = 0.0
+    last_modified: str = ''
+    version: str = '$LATEST'
+    state: str = 'Active'
+    architecture: str = 'x86_64'
+    region: str = ''
+
+    # Detalhes opcionais (somente quando include_details=True)
+    last_modified_epoch: int | None = None
+    description: str | None = None
+    timeout: int | None = None
+    memory_size: int | None = None
+    package_type: str | None = None
+    code_sha256: str | None = None
+    role: str | None = None
+    environment_variables: int | None = None
+    layers: int | None = None
+    vpc_config: dict[str, Any] | None = None
+    dead_letter_config: str | None = None
+    kms_key_arn: str | None = None
+    tracing_config: str | None = None
+    revision_id: str | None = None
+    file_system_configs: int | None = None
+    image_config: dict[str, Any] | None = None
+    ephemeral_storage: int | None = None
+
+    # Modo básico ('mais rápido' no --help) fica realmente enxuto: sem
+    # handler/version, que só interessam no relatório detalhado
+    _BASIC_FIELDS = (
+        'function_name',
+        'runtime',
+        'code_size',
+        'code_size_mb',
+        'last_modified',
+        'state',
+        'architecture',
+        'region',
+    )
+
+    def to_dict(self, include_details: bool = True) -> dict[str, Any]:
+        """Converte para dict serializável; em modo básico omite os detalhes"""
+        if include_details:
+            return asdict(self)
+        return {name: getattr(self, name) for name in self._BASIC_FIELDS}
 
 
 class LambdaFunctionLister:
@@ -32,12 +138,8 @@ class LambdaFunctionLister:
             region (str): Região AWS (padrão: us-east-1)
         """
         self.region = region
-        self.session = boto3.Session(
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_DEFAULT_REGION", region),
-        )
-        self.lambda_client = self.session.client('lambda')
+        self.session = _get_session(region)
+        self.lambda_client = _get_lambda_client(region)
         self.config_manager = ConfigManager()
 
     def list_all_functions(self, include_details: bool = True) -> dict[str, Any]:
@@ -52,31 +154,64 @@ class LambdaFunctionLister:
         """
         print("🔍 Buscando funções Lambda na conta...")
 
+        # Metadados compartilhados pelos retornos de sucesso e de erro
+        metadata = {
+            'generated_at': datetime.now(tz=UTC).isoformat(),
+            'region': self.region,
+            'account_id': self.config_manager.aws_config.account_id,
+            'include_details': include_details,
+        }
+
         try:
             functions = []
             paginator = self.lambda_client.get_paginator('list_functions')
 
-            # Usar paginação para listar todas as funções
-            for page in paginator.paginate():
-                for function in page['Functions']:
-                    function_info = self._process_function_info(
-                        function, include_details
+            # Produtor busca a próxima página da API enquanto o consumidor
+            # processa a atual; o processamento das entradas vai para o pool
+            pages: queue.Queue = queue.Queue(maxsize=4)
+            fetch_errors: list[Exception] = []
+
+            def _fetch_pages() -> None:
+                try:
+                    # PageSize no máximo da API (50) reduz o número de
+                    # round-trips pela metade em relação ao padrão
+                    for page in paginator.paginate(
+                        PaginationConfig={'PageSize': 50}
+                    ):
+                        pages.put(page)
+                except Exception as exc:
+                    fetch_errors.append(exc)
+                finally:
+                    pages.put(None)  # Sentinela de fim de paginação
+
+            producer = threading.Thread(target=_fetch_pages, daemon=True)
+            producer.start()
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                while True:
+                    page = pages.get()
+                    if page is None:
+                        break
+                    functions.extend(
+                        executor.map(
+                            lambda f: self._process_function_info(f, include_details),
+                            page['Functions'],
+                        )
                     )
-                    functions.append(function_info)
 
-            # Ordenar por nome da função
-            functions.sort(key=lambda x: x['function_name'].lower())
+            producer.join()
+            if fetch_errors:
+                raise fetch_errors[0]
+
+            # Ordenar por nome da função (a chave é avaliada uma vez por
+            # registro; casefold cobre comparação insensível a maiúsculas)
+            functions.sort(key=lambda x: x.function_name.casefold())
 
             # Calcular estatísticas
             statistics = self._calculate_statistics(functions)
 
             return {
-                'metadata': {
-                    'generated_at': datetime.now(tz=UTC).isoformat(),
-                    'region': self.region,
-                    'account_id': self.config_manager.aws_config.account_id,
-                    'include_details': include_details,
-                },
+                'metadata': metadata,
                 'statistics': statistics,
                 'functions': functions,
                 'status': 'success',
@@ -87,12 +222,7 @@ class LambdaFunctionLister:
             print(f"❌ Erro ao listar funções Lambda: {error_msg}")
 
             return {
-                'metadata': {
-                    'generated_at': datetime.now(tz=UTC).isoformat(),
-                    'region': self.region,
-                    'account_id': self.config_manager.aws_config.account_id,
-                    'include_details': include_details,
-                },
+                'metadata': metadata,
                 'statistics': {
                     'total_functions': 0,
                     'by_runtime': {},
@@ -106,9 +236,85 @@ class LambdaFunctionLister:
                 'error_message': error_msg,
             }
 
+    def list_all_functions_via_cli(self, include_details: bool = True) -> dict[str, Any]:
+        """
+        Lista as funções Lambda delegando a coleta ao AWS CLI v2
+
+        O binário em Go pagina e serializa mais rápido que o paginator do
+        boto3 em contas grandes; o resultado passa pelo mesmo processamento
+        e tem o mesmo formato de list_all_functions.
+
+        Args:
+            include_details (bool): Se deve incluir detalhes completos de cada função
+
+        Returns:
+            Dict com informações estruturadas das funções
+        """
+        print("🔍 Buscando funções Lambda via AWS CLI...")
+
+        metadata = {
+            'generated_at': datetime.now(tz=UTC).isoformat(),
+            'region': self.region,
+            'account_id': self.config_manager.aws_config.account_id,
+            'include_details': include_details,
+        }
+
+        try:
+            result = subprocess.run(
+                [
+                    'aws',
+                    'lambda',
+                    'list-functions',
+                    '--region',
+                    self.region,
+                    '--output',
+                    'json',
+                ],
+                capture_output=True,
+                check=True,
+            )
+
+            if orjson is not None:
+                payload = orjson.loads(result.stdout)
+            else:
+                payload = json.loads(result.stdout)
+
+            functions = [
+                self._process_function_info(f, include_details)
+                for f in payload.get('Functions', [])
+            ]
+            functions.sort(key=lambda x: x.function_name.casefold())
+
+            return {
+                'metadata': metadata,
+                'statistics': self._calculate_statistics(functions),
+                'functions': functions,
+                'status': 'success',
+            }
+
+        except FileNotFoundError:
+            # AWS CLI não instalado: segue pelo caminho boto3 normalmente
+            print("⚠️ AWS CLI não encontrado, usando boto3...")
+            return self.list_all_functions(include_details=include_details)
+
+        except Exception as e:
+            if isinstance(e, subprocess.CalledProcessError):
+                error_msg = e.stderr.decode(errors='replace').strip() or str(e)
+            else:
+                error_msg = str(e)
+            print(f"❌ Erro ao listar funções via AWS CLI: {error_msg}")
+
+            return {
+                'metadata': metadata,
+                'statistics': self._calculate_statistics([]),
+                'functions': [],
+                'status': 'error',
+                'error_message': error_msg,
+            }
+
     def _process_function_info(
         self, function: dict[str, Any], include_details: bool
-    ) -> dict[str, Any]:
+    ) -> FunctionInfo:
         """
         Processa informações de uma função Lambda
 
@@ -117,77 +323,70 @@ class LambdaFunctionLister:
             include_details (bool): Se deve incluir detalhes completos
 
         Returns:
-            Dict com informações processadas da função
+            FunctionInfo com informações processadas da função
         """
         # Informações básicas sempre incluídas
-        function_info = {
-            'function_name': function['FunctionName'],
-            'runtime': function.get('Runtime', 'N/A'),
-            'handler': function.get('Handler', 'N/A'),
-            'code_size': function.get('CodeSize', 0),
-            'last_modified': function.get('LastModified', ''),
-            'version': function.get('Version', '$LATEST'),
-            'state': function.get('State', 'Active'),
-            'architecture': (
-                function.get('Architectures', ['x86_64'])[0]
-                if function.get('Architectures')
-                else 'x86_64'
-            ),
-        }
+        info = FunctionInfo(
+            function_name=function['FunctionName'],
+            runtime=function.get('Runtime', 'N/A'),
+            handler=function.get('Handler', 'N/A'),
+            code_size=function.get('CodeSize', 0),
+            code_size_mb=round(function.get('CodeSize', 0) / (1024 * 1024), 2),
+            last_modified=function.get('LastModified', ''),
+            version=function.get('Version', '$LATEST'),
+            state=function.get('State', 'Active'),
+            architecture=(function.get('Architectures') or ('x86_64',))[0],
+            region=self.region,
+        )
 
         # Detalhes adicionais se solicitado
         if include_details:
-            function_info.update(
+            # Resolve os sub-dicionários opcionais uma única vez, evitando
+            # dicts vazios descartáveis a cada .get() repetido
+            vpc = function.get('VpcConfig') or {}
+            env = function.get('Environment') or {}
+            # Epoch pré-calculado: quem ordena/filtra por data compara ints
+            # em vez de re-parsear a string ISO registro a registro
+            info.last_modified_epoch = _parse_last_modified(info.last_modified)
+            info.description = function.get('Description', '')
+            info.timeout = function.get('Timeout', 3)
+            info.memory_size = function.get('MemorySize', 128)
+            info.package_type = function.get('PackageType', 'Zip')
+            info.code_sha256 = function.get('CodeSha256', '')
+            info.role = function.get('Role', '')
+            info.environment_variables = len(env.get('Variables') or {})
+            info.layers = len(function.get('Layers', ()))
+            info.vpc_config = (
                 {
-                    'description': function.get('Description', ''),
-                    'timeout': function.get('Timeout', 3),
-                    'memory_size': function.get('MemorySize', 128),
-                    'package_type': function.get('PackageType', 'Zip'),
-                    'code_sha256': function.get('CodeSha256', ''),
-                    'role': function.get('Role', ''),
-                    'environment_variables': len(
-                        function.get('Environment', {}).get('Variables', {})
-                    ),
-                    'layers': len(function.get('Layers', [])),
-                    'vpc_config': (
-                        {
-                            'vpc_id': function.get('VpcConfig', {}).get('VpcId', ''),
-                            'subnet_ids_count': len(
-                                function.get('VpcConfig', {}).get('SubnetIds', [])
-                            ),
-                            'security_group_ids_count': len(
-                                function.get('VpcConfig', {}).get(
-                                    'SecurityGroupIds', []
-                                )
-                            ),
-                        }
-                        if function.get('VpcConfig', {}).get('VpcId')
-                        else None
-                    ),
-                    'dead_letter_config': function.get('DeadLetterConfig', {}).get(
-                        'TargetArn', ''
-                    ),
-                    'kms_key_arn': function.get('KMSKeyArn', ''),
-                    'tracing_config': function.get('TracingConfig', {}).get(
-                        'Mode', 'PassThrough'
-                    ),
-                    'revision_id': function.get('RevisionId', ''),
-                    'file_system_configs': len(function.get('FileSystemConfigs', [])),
-                    'image_config': function.get('ImageConfig', {}),
-                    'ephemeral_storage': function.get('EphemeralStorage', {}).get(
-                        'Size', 512
-                    ),
+                    'vpc_id': vpc.get('VpcId', ''),
+                    'subnet_ids_count': len(vpc.get('SubnetIds', ())),
+                    'security_group_ids_count': len(vpc.get('SecurityGroupIds', ())),
                 }
+                if vpc.get('VpcId')
+                else None
+            )
+            info.dead_letter_config = (function.get('DeadLetterConfig') or {}).get(
+                'TargetArn', ''
+            )
+            info.kms_key_arn = function.get('KMSKeyArn', '')
+            info.tracing_config = (function.get('TracingConfig') or {}).get(
+                'Mode', 'PassThrough'
+            )
+            info.revision_id = function.get('RevisionId', '')
+            info.file_system_configs = len(function.get('FileSystemConfigs', ()))
+            info.image_config = function.get('ImageConfig', {})
+            info.ephemeral_storage = (function.get('EphemeralStorage') or {}).get(
+                'Size', 512
             )
 
-        return function_info
+        return info
 
-    def _calculate_statistics(self, functions: list[dict[str, Any]]) -> dict[str, Any]:
+    def _calculate_statistics(self, functions: list[FunctionInfo]) -> dict[str, Any]:
         """
         Calcula estatísticas das funções Lambda
 
         Args:
-            functions (List[Dict]): Lista de funções processadas
+            functions (List[FunctionInfo]): Lista de funções processadas
 
         Returns:
             Dict com estatísticas calculadas
@@ -203,36 +402,29 @@ class LambdaFunctionLister:
                 'average_memory': 0,
             }
 
-        # Contadores
-        by_runtime = {}
-        by_architecture = {}
-        by_state = {}
-        total_code_size = 0
-        total_timeout = 0
-        total_memory = 0
-        functions_with_details = 0
-
-        for func in functions:
-            # Runtime
-            runtime = func.get('runtime', 'N/A')
-            by_runtime[runtime] = by_runtime.get(runtime, 0) + 1
-
-            # Arquitetura
-            arch = func.get('architecture', 'x86_64')
-            by_architecture[arch] = by_architecture.get(arch, 0) + 1
-
-            # Estado
-            state = func.get('state', 'Active')
-            by_state[state] = by_state.get(state, 0) + 1
-
-            # Tamanho do código
-            total_code_size += func.get('code_size', 0)
-
-            # Timeout e memória (apenas se detalhes estão incluídos)
-            if 'timeout' in func and 'memory_size' in func:
-                total_timeout += func['timeout']
-                total_memory += func['memory_size']
-                functions_with_details += 1
+        # Em contas grandes o value_counts do pandas (C/NumPy) ganha dos
+        # Counters; abaixo do corte o custo de importar pandas não compensa
+        if len(functions) > 500:
+            try:
+                import pandas as pd
+            except ImportError:  # Dependência opcional: segue com Counter
+                pd = None
+            if pd is not None:
+                return self._calculate_statistics_pandas(pd, functions)
+
+        # Contadores em uma passada cada, com a contagem feita em C
+        by_runtime = Counter(map(attrgetter('runtime'), functions))
+        by_architecture = Counter(map(attrgetter('architecture'), functions))
+        by_state = Counter(map(attrgetter('state'), functions))
+        total_code_size = sum(map(attrgetter('code_size'), functions))
+
+        # Timeout e memória (apenas se detalhes estão incluídos)
+        detailed = [
+            f for f in functions if f.timeout is not None and f.memory_size is not None
+        ]
+        functions_with_details = len(detailed)
+        total_timeout = sum(map(attrgetter('timeout'), detailed))
+        total_memory = sum(map(attrgetter('memory_size'), detailed))
 
         return {
             'total_functions': len(functions),
@@ -253,6 +445,55 @@ class LambdaFunctionLister:
             ),
         }
 
+    def _calculate_statistics_pandas(
+        self, pd, functions: list[FunctionInfo]
+    ) -> dict[str, Any]:
+        """
+        Versão vetorizada de _calculate_statistics para listas grandes
+
+        Args:
+            pd: Módulo pandas já importado
+            functions (List[FunctionInfo]): Lista de funções processadas
+
+        Returns:
+            Dict com estatísticas calculadas (mesmo formato do caminho Counter)
+        """
+        df = pd.DataFrame(
+            {
+                'runtime': [f.runtime for f in functions],
+                'architecture': [f.architecture for f in functions],
+                'state': [f.state for f in functions],
+                'code_size': [f.code_size for f in functions],
+                'timeout': [f.timeout for f in functions],
+                'memory_size': [f.memory_size for f in functions],
+            }
+        )
+
+        total_code_size = int(df['code_size'].sum())
+        detailed = df.dropna(subset=['timeout', 'memory_size'])
+        functions_with_details = len(detailed)
+
+        return {
+            'total_functions': len(functions),
+            'by_runtime': df['runtime'].value_counts().sort_index().to_dict(),
+            'by_architecture': (
+                df['architecture'].value_counts().sort_index().to_dict()
+            ),
+            'by_state': df['state'].value_counts().sort_index().to_dict(),
+            'total_code_size': total_code_size,
+            'total_code_size_mb': round(total_code_size / (1024 * 1024), 2),
+            'average_timeout': (
+                round(float(detailed['timeout'].mean()), 1)
+                if functions_with_details > 0
+                else 0
+            ),
+            'average_memory': (
+                round(float(detailed['memory_size'].mean()), 1)
+                if functions_with_details > 0
+                else 0
+            ),
+        }
+
     def filter_functions(
         self, data: dict[str, Any], filters: dict[str, Any]
     ) -> dict[str, Any]:
@@ -269,43 +510,29 @@ class LambdaFunctionLister:
         if data['status'] != 'success':
             return data
 
-        filtered_functions = data['functions'].copy()
+        # Monta um predicado por filtro ativo e aplica todos em uma única
+        # passada, em vez de reconstruir a lista a cada filtro
+        predicates = []
 
-        # Filtro por runtime
         if filters.get('runtime'):
             runtime_filter = filters['runtime'].lower()
-            filtered_functions = [
-                f
-                for f in filtered_functions
-                if runtime_filter in f.get('runtime', '').lower()
-            ]
+            predicates.append(lambda f: runtime_filter in f.runtime.lower())
 
-        # Filtro por nome (substring)
         if filters.get('name'):
             name_filter = filters['name'].lower()
-            filtered_functions = [
-                f
-                for f in filtered_functions
-                if name_filter in f.get('function_name', '').lower()
-            ]
+            predicates.append(lambda f: name_filter in f.function_name.lower())
 
-        # Filtro por estado
         if filters.get('state'):
-            state_filter = filters['state']
-            filtered_functions = [
-                f
-                for f in filtered_functions
-                if f.get('state', '').lower() == state_filter.lower()
-            ]
+            state_filter = filters['state'].lower()
+            predicates.append(lambda f: f.state.lower() == state_filter)
 
-        # Filtro por arquitetura
         if filters.get('architecture'):
-            arch_filter = filters['architecture']
-            filtered_functions = [
-                f
-                for f in filtered_functions
-                if f.get('architecture', '').lower() == arch_filter.lower()
-            ]
+            arch_filter = filters['architecture'].lower()
+            predicates.append(lambda f: f.architecture.lower() == arch_filter)
+
+        filtered_functions = [
+            f for f in data['functions'] if all(p(f) for p in predicates)
+        ]
 
         # Recalcular estatísticas para dados filtrados
         filtered_statistics = self._calculate_statistics(filtered_functions)
@@ -337,9 +564,22 @@ class LambdaFunctionLister:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"lambda_functions_{timestamp}.json"
 
+        # Materializa os registros FunctionInfo como dicts apenas na serialização
+        include_details = data.get('metadata', {}).get('include_details', True)
+        data = {
+            **data,
+            'functions': [f.to_dict(include_details) for f in data['functions']],
+        }
+
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # Serializa em C direto para bytes UTF-8, bem mais rápido que
+                # o pretty-print do json da stdlib
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
             print(f"💾 Lista de funções salva em: {filename}")
             return filename
@@ -362,56 +602,114 @@ class LambdaFunctionLister:
         metadata = data['metadata']
         statistics = data['statistics']
 
-        print("\n" + "=" * 80)
-        print("📊 RESUMO DAS FUNÇÕES LAMBDA")
-        print("=" * 80)
-        print(f"🕐 Gerado em: {metadata['generated_at']}")
-        print(f"🌍 Região: {metadata['region']}")
-        print(f"🏢 Account ID: {metadata['account_id']}")
+        # Monta o resumo inteiro em memória e emite com um único write,
+        # em vez de um syscall por print no loop de funções
+        buf = io.StringIO()
+        buf.write("\n" + "=" * 80 + "\n")
+        buf.write("📊 RESUMO DAS FUNÇÕES LAMBDA\n")
+        buf.write("=" * 80 + "\n")
+        buf.write(f"🕐 Gerado em: {metadata['generated_at']}\n")
+        buf.write(f"🌍 Região: {metadata['region']}\n")
+        buf.write(f"🏢 Account ID: {metadata['account_id']}\n")
 
         if metadata.get('filters_applied'):
-            print(f"🔍 Filtros aplicados: {metadata['filters_applied']}")
-            print(f"📊 Funções originais: {metadata['original_count']}")
-            print(f"📊 Funções filtradas: {metadata['filtered_count']}")
-
-        print("\n📋 ESTATÍSTICAS GERAIS:")
-        print(f"   • Total de funções: {statistics['total_functions']}")
-        print(f"   • Tamanho total do código: {statistics['total_code_size_mb']} MB")
+            buf.write(f"🔍 Filtros aplicados: {metadata['filters_applied']}\n")
+            buf.write(f"📊 Funções originais: {metadata['original_count']}\n")
+            buf.write(f"📊 Funções filtradas: {metadata['filtered_count']}\n")
+
+        buf.write("\n📋 ESTATÍSTICAS GERAIS:\n")
+        buf.write(f"   • Total de funções: {statistics['total_functions']}\n")
+        buf.write(
+            f"   • Tamanho total do código: {statistics['total_code_size_mb']} MB\n"
+        )
 
         if statistics['average_timeout'] > 0:
-            print(f"   • Timeout médio: {statistics['average_timeout']}s")
-            print(f"   • Memória média: {statistics['average_memory']} MB")
+            buf.write(f"   • Timeout médio: {statistics['average_timeout']}s\n")
+            buf.write(f"   • Memória média: {statistics['average_memory']} MB\n")
 
-        print("\n🔧 POR RUNTIME:")
+        buf.write("\n🔧 POR RUNTIME:\n")
         for runtime, count in statistics['by_runtime'].items():
-            print(f"   • {runtime}: {count}")
+            buf.write(f"   • {runtime}: {count}\n")
 
-        print("\n🏗️ POR ARQUITETURA:")
+        buf.write("\n🏗️ POR ARQUITETURA:\n")
         for arch, count in statistics['by_architecture'].items():
-            print(f"   • {arch}: {count}")
+            buf.write(f"   • {arch}: {count}\n")
 
-        print("\n📊 POR ESTADO:")
+        buf.write("\n📊 POR ESTADO:\n")
         for state, count in statistics['by_state'].items():
-            print(f"   • {state}: {count}")
+            buf.write(f"   • {state}: {count}\n")
 
-        print("\n📋 LISTA DE FUNÇÕES:")
-        print("-" * 80)
+        buf.write("\n📋 LISTA DE FUNÇÕES:\n")
+        buf.write("-" * 80 + "\n")
 
+        include_details = metadata.get('include_details')
         for func in data['functions']:
-            state_icon = "✅" if func.get('state') == 'Active' else "⚠️"
-            print(f"{state_icon} {func['function_name']}")
-            print(f"   • Runtime: {func['runtime']}")
-            print(f"   • Tamanho: {round(func['code_size'] / (1024 * 1024), 2)} MB")
-            print(f"   • Última modificação: {func['last_modified']}")
-
-            if metadata.get('include_details') and 'timeout' in func:
-                print(
-                    f"   • Timeout: {func['timeout']}s | Memória: {func['memory_size']} MB"
+            state_icon = "✅" if func.state == 'Active' else "⚠️"
+            buf.write(f"{state_icon} {func.function_name}\n")
+            buf.write(f"   • Runtime: {func.runtime}\n")
+            buf.write(f"   • Tamanho: {func.code_size_mb} MB\n")
+            buf.write(f"   • Última modificação: {func.last_modified}\n")
+
+            if include_details and func.timeout is not None:
+                buf.write(
+                    f"   • Timeout: {func.timeout}s | Memória: {func.memory_size} MB\n"
                 )
 
-            print()
+            buf.write("\n")
 
-        print("=" * 80)
+        buf.write("=" * 80 + "\n")
+        sys.stdout.write(buf.getvalue())
+
+
+def list_functions_all_regions(include_details: bool = True) -> dict[str, Any]:
+    """
+    Lista funções Lambda de todas as regiões em paralelo
+
+    Uma thread por região mantém as ~20 chamadas de rede sobrepostas, então
+    o tempo total fica próximo ao da região mais lenta em vez da soma.
+
+    Args:
+        include_details (bool): Se deve incluir detalhes completos de cada função
+
+    Returns:
+        Dict no mesmo formato de list_all_functions, com as funções de todas
+        as regiões mescladas e os erros por região em metadata
+    """
+    regions = _get_session('us-east-1').get_available_regions('lambda')
+    print(f"🌍 Coletando funções em {len(regions)} regiões em paralelo...")
+
+    def _collect(region: str) -> dict[str, Any]:
+        return LambdaFunctionLister(region=region).list_all_functions(
+            include_details=include_details
+        )
+
+    with ThreadPoolExecutor(max_workers=min(16, len(regions))) as executor:
+        results = list(executor.map(_collect, regions))
+
+    functions: list[FunctionInfo] = []
+    region_errors: dict[str, str] = {}
+    for region, result in zip(regions, results, strict=True):
+        if result['status'] == 'success':
+            functions.extend(result['functions'])
+        else:
+            region_errors[region] = result.get('error_message', 'Erro desconhecido')
+
+    functions.sort(key=lambda x: x.function_name.casefold())
+    lister = LambdaFunctionLister(region='us-east-1')
+
+    return {
+        'metadata': {
+            'generated_at': datetime.now(tz=UTC).isoformat(),
+            'region': 'all',
+            'regions_scanned': len(regions),
+            'region_errors': region_errors,
+            'account_id': lister.config_manager.aws_config.account_id,
+            'include_details': include_details,
+        },
+        'statistics': lister._calculate_statistics(functions),
+        'functions': functions,
+        'status': 'success',
+    }
 
 
 def main():
@@ -470,6 +768,18 @@ Exemplos de uso:
         help='Filtrar por arquitetura',
     )
 
+    parser.add_argument(
+        '--all-regions',
+        action='store_true',
+        help='Listar funções de todas as regiões em paralelo',
+    )
+
+    parser.add_argument(
+        '--use-cli',
+        action='store_true',
+        help='Coletar via AWS CLI v2 (mais rápido em contas grandes)',
+    )
+
     parser.add_argument(
         '--console-only',
         action='store_true',
@@ -479,21 +789,31 @@ Exemplos de uso:
     parser.add_argument('--output', type=str, help='Nome do arquivo de saída JSON')
 
     parser.add_argument(
-        '--region', type=str, default='us-east-1', help='Região AWS (padrão: us-east-1)'
+        '--region',
+        type=str,
+        default=os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
+        help='Região AWS (padrão: us-east-1)',
     )
 
     args = parser.parse_args()
 
-    # Verificar credenciais AWS
-    try:
-        session = boto3.Session()
-        credentials = session.get_credentials()
-        if not credentials:
-            print("❌ Credenciais AWS não encontradas.")
-            print("💡 Configure com: aws configure ou arquivo .env")
-            sys.exit(1)
-    except Exception as e:
-        print(f"❌ Erro com credenciais AWS: {str(e)}")
+    # Carrega o .env só depois do argparse, mantendo --help instantâneo
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    # Sondagem barata de credenciais: basta detectar a ausência total sem
+    # construir uma sessão boto3 só para isso; a validação real acontece
+    # (e falha com mensagem clara) na primeira chamada à API
+    has_credentials = (
+        os.getenv('AWS_ACCESS_KEY_ID')
+        or os.getenv('AWS_PROFILE')
+        or os.getenv('AWS_ROLE_ARN')
+        or os.path.exists(os.path.expanduser('~/.aws/credentials'))
+    )
+    if not has_credentials:
+        print("❌ Credenciais AWS não encontradas.")
+        print("💡 Configure com: aws configure ou arquivo .env")
         sys.exit(1)
 
     # Inicializar lister
@@ -509,7 +829,12 @@ Exemplos de uso:
             f"🔄 Coletando {'informações detalhadas' if include_details else 'informações básicas'}..."
         )
 
-        results = lister.list_all_functions(include_details=include_details)
+        if args.all_regions:
+            results = list_functions_all_regions(include_details=include_details)
+        elif args.use_cli:
+            results = lister.list_all_functions_via_cli(include_details=include_details)
+        else:
+            results = lister.list_all_functions(include_details=include_details)
 
         if results['status'] != 'success':
             print(
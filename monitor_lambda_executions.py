@@ -5,26 +5,76 @@ Monitora execuções ativas, métricas e status das funções Lambda em tempo re
 """
 
 import argparse
+import atexit
 import json
 import os
+import select
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from dotenv import load_dotenv
 
 from config_utils import ConfigManager
 
+try:
+    import orjson
+except ImportError:  # Dependência opcional: cai no json da stdlib
+    orjson = None
+
 load_dotenv()
 
+# Linhas e prefixos constantes do display, montados uma única vez; nas
+# linhas quentes (uma por função por repintura) a concatenação com str()
+# sai mais barata que re-interpolar uma f-string com prefixo fixo
+_RULE_WIDE = "=" * 100
+_RULE_NARROW = "-" * 80
+_LINE_CONCURRENT = "   🔥 Execuções simultâneas: "
+_LINE_DURATION = "   ⏱️  Duração média: "
+_LINE_SUCCESS = "   ✅ Taxa sucesso: "
+_FMT_INV_ERR = "   📈 Invocações: {} | Erros: {}".format
+_FMT_INV_ERR_THR = "   📊 Invocações: {} | Erros: {} | Throttles: {}".format
+_FMT_RATE_DUR = "   📈 Taxa sucesso: {}% | Duração média: {}ms".format
+
 
 class LambdaExecutionMonitor:
     """
     Classe principal para monitoramento de execuções Lambda em tempo real
     """
 
+    # Modelo fixo das métricas consultadas por função:
+    # (prefixo do Id, métrica, estatística, período em segundos ou None
+    # para usar a janela de monitoramento completa). As rápidas alimentam o
+    # indicador 'executando agora' a cada tick; as lentas mudam em escala de
+    # minutos e são renovadas a cada 60s (entre renovações os valores vêm de
+    # previous_metrics)
+    _FAST_SPECS = (
+        ('inv', 'Invocations', 'Sum', None),
+        ('con', 'ConcurrentExecutions', 'Maximum', 60),
+    )
+    _SLOW_SPECS = (
+        ('dur', 'Duration', 'Average', None),
+        ('err', 'Errors', 'Sum', None),
+        ('thr', 'Throttles', 'Sum', None),
+    )
+
+    # Arquivo de cache quente com as métricas da execução anterior
+    _CACHE_FILE = '.lambda_monitor_cache.json'
+
+    # Despacho dos resultados: prefixo do Id -> campo de métricas e conversor
+    _RESULT_FIELDS = (
+        ('inv', 'invocations', int),
+        ('dur', 'duration_avg', lambda v: round(v, 2)),
+        ('err', 'errors', int),
+        ('thr', 'throttles', int),
+        ('con', 'concurrent_executions', int),
+    )
+
     def __init__(self, region: str = 'us-east-1'):
         """
         Inicializa o monitor com configuração AWS
@@ -39,9 +89,17 @@ class LambdaExecutionMonitor:
             region_name=os.getenv("AWS_DEFAULT_REGION", region),
         )
 
-        # Clientes AWS
-        self.cloudwatch = self.session.client('cloudwatch')
-        self.lambda_client = self.session.client('lambda')
+        # Clientes AWS com pool dimensionado para os ticks: keepalive evita
+        # refazer TLS a cada atualização e o retry adaptativo recua quando o
+        # CloudWatch começa a limitar
+        client_config = Config(
+            max_pool_connections=64,
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+            tcp_keepalive=True,
+            user_agent_extra='kuri-lambda-monitor/1.0',
+        )
+        self.cloudwatch = self.session.client('cloudwatch', config=client_config)
+        self.lambda_client = self.session.client('lambda', config=client_config)
 
         # Configuração
         self.config_manager = ConfigManager()
@@ -54,22 +112,78 @@ class LambdaExecutionMonitor:
         # Cache para comparação
         self.previous_metrics = {}
 
-    def get_function_metrics(self, function_name: str) -> dict[str, Any]:
+        # Cache do conjunto de funções implantadas (renovado por TTL)
+        self._function_set_cache: set[str] = set()
+        self._function_set_ts: float = 0.0
+
+        # Fim da última janela coletada (habilita janelas incrementais)
+        self._last_fetch_end: datetime | None = None
+
+        # Último datapoint real por função; limita a validade dos valores
+        # reaproveitados de previous_metrics quando a função fica ociosa
+        self._last_datapoint_ts: dict[str, float] = {}
+
+        # Última renovação das métricas de mudança lenta
+        self._slow_metric_last: float = 0.0
+
+        # Dimensões por função, reutilizadas entre ticks nas queries
+        self._dims_cache: dict[str, list[dict[str, str]]] = {}
+
+        # Assinatura do último frame exibido (evita repintar sem mudança)
+        self._last_display_sig: int | None = None
+
+        # Handle persistente do arquivo de log (aberto no primeiro uso)
+        self._log_fh = None
+
+        # Flag de parada ligada pelo handler de SIGINT
+        self._stop = False
+
+        # Esqueleto do payload por tick, clonado raso a cada coleta em vez
+        # de reconstruir os literais aninhados
+        self._results_template = {
+            'timestamp': '',
+            'total_functions': 0,
+            'monitoring_period_minutes': self.metric_period,
+            'functions': {},
+            'summary': {
+                'active_functions': 0,
+                'executing_functions': 0,
+                'total_invocations': 0,
+                'total_errors': 0,
+                'functions_with_errors': 0,
+                'functions_with_throttles': 0,
+            },
+        }
+
+        # Listas de classificação reutilizadas entre repinturas
+        self._executing_list: list = []
+        self._active_list: list = []
+        self._inactive_list: list = []
+
+        # Reinício quente: reaproveita métricas da execução anterior para o
+        # primeiro tick já partir com janela incremental e valores exibíveis
+        self._load_warm_cache()
+
+    def get_function_metrics(
+        self, function_name: str, ts_iso: str | None = None
+    ) -> dict[str, Any]:
         """
-        Coleta métricas de uma função Lambda específica
+        Monta a estrutura de métricas de uma função e verifica sua existência
+
+        Os valores de CloudWatch são preenchidos em lote por
+        get_all_functions_metrics; aqui fica apenas o esqueleto e o status.
 
         Args:
             function_name (str): Nome da função Lambda
+            ts_iso (str, opcional): Timestamp do tick, calculado uma vez pelo
+                chamador; se omitido é gerado aqui
 
         Returns:
-            Dict com métricas da função
+            Dict com métricas zeradas da função e status preenchido
         """
-        end_time = datetime.now(tz=UTC)
-        start_time = end_time - timedelta(minutes=self.metric_period)
-
         metrics = {
             'function_name': function_name,
-            'timestamp': end_time.isoformat(),
+            'timestamp': ts_iso or datetime.now(tz=UTC).isoformat(),
             'status': 'unknown',
             'invocations': 0,
             'duration_avg': 0.0,
@@ -81,136 +195,139 @@ class LambdaExecutionMonitor:
             'error_rate': 0.0,
         }
 
+        # Verificar se a função existe (contra o cache de funções implantadas,
+        # em vez de um get_function por função a cada tick)
         try:
-            # Verificar se a função existe
-            try:
-                self.lambda_client.get_function(FunctionName=function_name)
-                metrics['status'] = 'active'
-            except self.lambda_client.exceptions.ResourceNotFoundException:
-                metrics['status'] = 'not_found'
-                return metrics
-            except Exception:
-                metrics['status'] = 'error'
-                return metrics
-
-            # Coletar métricas do CloudWatch
-            metric_queries = [
-                {
-                    'Id': 'invocations',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/Lambda',
-                            'MetricName': 'Invocations',
-                            'Dimensions': [
-                                {'Name': 'FunctionName', 'Value': function_name}
-                            ],
-                        },
-                        'Period': 60,
-                        'Stat': 'Sum',
-                    },
-                },
-                {
-                    'Id': 'duration',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/Lambda',
-                            'MetricName': 'Duration',
-                            'Dimensions': [
-                                {'Name': 'FunctionName', 'Value': function_name}
-                            ],
-                        },
-                        'Period': 60,
-                        'Stat': 'Average',
-                    },
-                },
-                {
-                    'Id': 'errors',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/Lambda',
-                            'MetricName': 'Errors',
-                            'Dimensions': [
-                                {'Name': 'FunctionName', 'Value': function_name}
-                            ],
-                        },
-                        'Period': 60,
-                        'Stat': 'Sum',
-                    },
-                },
-                {
-                    'Id': 'throttles',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/Lambda',
-                            'MetricName': 'Throttles',
-                            'Dimensions': [
-                                {'Name': 'FunctionName', 'Value': function_name}
-                            ],
-                        },
-                        'Period': 60,
-                        'Stat': 'Sum',
-                    },
-                },
-                {
-                    'Id': 'concurrent',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/Lambda',
-                            'MetricName': 'ConcurrentExecutions',
-                            'Dimensions': [
-                                {'Name': 'FunctionName', 'Value': function_name}
-                            ],
-                        },
-                        'Period': 60,
-                        'Stat': 'Maximum',
-                    },
-                },
-            ]
-
-            # Executar consulta de métricas
-            response = self.cloudwatch.get_metric_data(
-                MetricDataQueries=metric_queries, StartTime=start_time, EndTime=end_time
+            deployed = self._get_deployed_function_names()
+            metrics['status'] = (
+                'active' if function_name in deployed else 'not_found'
             )
+        except Exception:
+            metrics['status'] = 'error'
 
-            # Processar resultados
-            for result in response['MetricDataResults']:
-                if result['Values']:
-                    latest_value = result['Values'][-1]
-
-                    if result['Id'] == 'invocations':
-                        metrics['invocations'] = int(latest_value)
-                    elif result['Id'] == 'duration':
-                        metrics['duration_avg'] = round(latest_value, 2)
-                    elif result['Id'] == 'errors':
-                        metrics['errors'] = int(latest_value)
-                    elif result['Id'] == 'throttles':
-                        metrics['throttles'] = int(latest_value)
-                    elif result['Id'] == 'concurrent':
-                        metrics['concurrent_executions'] = int(latest_value)
-
-            # Calcular métricas derivadas
-            if metrics['invocations'] > 0:
-                metrics['success_rate'] = round(
-                    (
-                        (metrics['invocations'] - metrics['errors'])
-                        / metrics['invocations']
-                    )
-                    * 100,
-                    1,
-                )
-                metrics['error_rate'] = round(
-                    (metrics['errors'] / metrics['invocations']) * 100, 1
+        return metrics
+
+    def _get_deployed_function_names(self) -> set[str]:
+        """
+        Retorna o conjunto de funções implantadas na conta
+
+        Uma chamada list_functions paginada renovada a cada 60 segundos
+        substitui os N get_function por tick; o conjunto muda raramente.
+
+        Returns:
+            Set com os nomes das funções implantadas
+        """
+        if time.time() - self._function_set_ts > 60:
+            paginator = self.lambda_client.get_paginator('list_functions')
+            self._function_set_cache = {
+                f['FunctionName']
+                for page in paginator.paginate()
+                for f in page['Functions']
+            }
+            self._function_set_ts = time.time()
+
+        return self._function_set_cache
+
+    def _fetch_metrics_batch(
+        self,
+        function_names: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        include_slow: bool = True,
+    ) -> dict[str, dict[str, float]]:
+        """
+        Busca as métricas de todas as funções em chamadas get_metric_data em lote
+
+        Uma única consulta carrega as 5 métricas de N funções (em fatias de
+        500 queries, o limite da API), em vez de uma chamada HTTPS por função.
+
+        Args:
+            function_names (List[str]): Funções a consultar
+            start_time (datetime): Início da janela de métricas
+            end_time (datetime): Fim da janela de métricas
+            include_slow (bool): Se deve incluir as métricas de mudança lenta
+
+        Returns:
+            Dict função -> {métrica: último valor}
+        """
+        # Período alinhado à janela: o CloudWatch agrega do lado do servidor
+        # e devolve um datapoint por query em vez de um por minuto; apenas o
+        # ConcurrentExecutions continua em 60s para o indicador 'executando'
+        window_period = self.metric_period * 60
+        specs = self._FAST_SPECS + self._SLOW_SPECS if include_slow else self._FAST_SPECS
+
+        queries = []
+        id_map = {}
+        for i, function_name in enumerate(function_names):
+            # A lista de dimensões de cada função é imutável entre ticks;
+            # reutilizar o mesmo objeto evita realocá-la a cada consulta
+            dimensions = self._dims_cache.get(function_name)
+            if dimensions is None:
+                dimensions = [{'Name': 'FunctionName', 'Value': function_name}]
+                self._dims_cache[function_name] = dimensions
+            for prefix, metric_name, stat, period in specs:
+                period = period or window_period
+                query_id = f'{prefix}_{i}'
+                id_map[query_id] = (function_name, prefix)
+                queries.append(
+                    {
+                        'Id': query_id,
+                        'MetricStat': {
+                            'Metric': {
+                                'Namespace': 'AWS/Lambda',
+                                'MetricName': metric_name,
+                                'Dimensions': dimensions,
+                            },
+                            'Period': period,
+                            'Stat': stat,
+                        },
+                    }
                 )
 
-            # Detectar se está executando (baseado em execuções concorrentes)
-            metrics['is_executing'] = metrics['concurrent_executions'] > 0
+        def _fetch_chunk(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            """Busca uma fatia de queries, seguindo o NextToken até o fim"""
+            chunk_results = []
+            next_token = None
+            while True:
+                kwargs = {
+                    'MetricDataQueries': chunk,
+                    'StartTime': start_time,
+                    'EndTime': end_time,
+                }
+                if next_token:
+                    kwargs['NextToken'] = next_token
+                response = self.cloudwatch.get_metric_data(**kwargs)
+                chunk_results.extend(response['MetricDataResults'])
+
+                next_token = response.get('NextToken')
+                if not next_token:
+                    return chunk_results
+
+        # Fatias de até 500 queries (limite da API); acima de 100 funções
+        # (500 queries) as fatias são buscadas em paralelo, já que o cliente
+        # botocore é seguro para leituras concorrentes
+        chunks = [queries[i : i + 500] for i in range(0, len(queries), 500)]
+        latest_values: dict[str, dict[str, float]] = {}
+
+        if len(chunks) == 1:
+            metric_results = _fetch_chunk(chunks[0])
+        else:
+            max_workers = min(
+                int(os.getenv("LAMBDA_MONITOR_CONCURRENCY", "16")), len(chunks)
+            )
+            metric_results = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for chunk_results in executor.map(_fetch_chunk, chunks):
+                    metric_results.extend(chunk_results)
 
-            return metrics
+        for result in metric_results:
+            if result['Values']:
+                function_name, prefix = id_map[result['Id']]
+                latest_values.setdefault(function_name, {})[prefix] = result[
+                    'Values'
+                ][-1]
 
-        except Exception as e:
-            metrics['status'] = 'error'
-            metrics['error_message'] = str(e)
-            return metrics
+        return latest_values
 
     def get_all_functions_metrics(self) -> dict[str, Any]:
         """
@@ -221,40 +338,118 @@ class LambdaExecutionMonitor:
         """
         functions = self.lambda_config.get_all_available_functions()
 
+        # Timestamp do tick calculado uma única vez e compartilhado pelo
+        # payload e pelos esqueletos por função
+        now = datetime.now(tz=UTC)
+        ts_iso = now.isoformat()
+
         results = {
-            'timestamp': datetime.now(tz=UTC).isoformat(),
+            **self._results_template,
+            'timestamp': ts_iso,
             'total_functions': len(functions),
             'monitoring_period_minutes': self.metric_period,
             'functions': {},
-            'summary': {
-                'active_functions': 0,
-                'executing_functions': 0,
-                'total_invocations': 0,
-                'total_errors': 0,
-                'functions_with_errors': 0,
-                'functions_with_throttles': 0,
-            },
+            'summary': dict(self._results_template['summary']),
         }
 
         for function_name in functions:
-            metrics = self.get_function_metrics(function_name)
-            results['functions'][function_name] = metrics
+            results['functions'][function_name] = self.get_function_metrics(
+                function_name, ts_iso=ts_iso
+            )
 
-            # Atualizar resumo
-            if metrics['status'] == 'active':
-                results['summary']['active_functions'] += 1
+        # Uma consulta em lote ao CloudWatch para todas as funções ativas
+        active_functions = [
+            name
+            for name, metrics in results['functions'].items()
+            if metrics['status'] == 'active'
+        ]
 
-            if metrics['is_executing']:
-                results['summary']['executing_functions'] += 1
+        if active_functions:
+            end_time = now
+            start_time = end_time - timedelta(minutes=self.metric_period)
 
-            results['summary']['total_invocations'] += metrics['invocations']
-            results['summary']['total_errors'] += metrics['errors']
+            # Janela incremental: após a primeira coleta, pede ao CloudWatch
+            # apenas o delta desde o último tick; valores sem datapoint novo
+            # são reaproveitados de previous_metrics
+            if self._last_fetch_end is not None:
+                start_time = max(start_time, self._last_fetch_end)
 
-            if metrics['errors'] > 0:
-                results['summary']['functions_with_errors'] += 1
+            # Métricas lentas (duração, erros, throttles) só a cada 60s;
+            # nos demais ticks apenas invocações e execuções concorrentes
+            include_slow = time.time() - self._slow_metric_last >= 60
 
-            if metrics['throttles'] > 0:
-                results['summary']['functions_with_throttles'] += 1
+            try:
+                latest_values = self._fetch_metrics_batch(
+                    active_functions, start_time, end_time, include_slow=include_slow
+                )
+                self._last_fetch_end = end_time
+                if include_slow:
+                    self._slow_metric_last = time.time()
+            except Exception as e:
+                error_msg = str(e)
+                print(f"❌ Erro ao consultar métricas no CloudWatch: {error_msg}")
+                latest_values = {}
+                for function_name in active_functions:
+                    metrics = results['functions'][function_name]
+                    metrics['status'] = 'error'
+                    metrics['error_message'] = error_msg
+
+            # Uma passada dirigida pela tabela prefixo -> (campo, conversor),
+            # em vez de um bloco condicional por métrica; o resumo acumula na
+            # mesma passada (funções não ativas só têm zeros a contribuir)
+            summary = results['summary']
+            now_ts = time.time()
+            carry_max_age = self.metric_period * 60
+            for function_name in active_functions:
+                values = latest_values.get(function_name, {})
+                metrics = results['functions'][function_name]
+
+                # Reaproveitar valores antigos só enquanto o último datapoint
+                # real couber na janela de métricas; depois disso a função
+                # está ociosa e os campos voltam a zero (como no CloudWatch)
+                if values:
+                    self._last_datapoint_ts[function_name] = now_ts
+                if now_ts - self._last_datapoint_ts.get(function_name, 0) <= carry_max_age:
+                    previous = self.previous_metrics.get(function_name, {})
+                else:
+                    previous = {}
+
+                for prefix, field, convert in self._RESULT_FIELDS:
+                    if prefix in values:
+                        metrics[field] = convert(values[prefix])
+                    else:
+                        metrics[field] = previous.get(field, metrics[field])
+
+                # Calcular métricas derivadas
+                invocations = metrics['invocations']
+                errors = metrics['errors']
+                if invocations > 0:
+                    metrics['success_rate'] = round(
+                        ((invocations - errors) / invocations) * 100, 1
+                    )
+                    metrics['error_rate'] = round((errors / invocations) * 100, 1)
+
+                # Detectar se está executando (baseado em execuções concorrentes)
+                is_executing = metrics['concurrent_executions'] > 0
+                metrics['is_executing'] = is_executing
+
+                self.previous_metrics[function_name] = dict(metrics)
+
+                # Atualizar resumo
+                if metrics['status'] == 'active':
+                    summary['active_functions'] += 1
+
+                if is_executing:
+                    summary['executing_functions'] += 1
+
+                summary['total_invocations'] += invocations
+                summary['total_errors'] += errors
+
+                if errors > 0:
+                    summary['functions_with_errors'] += 1
+
+                if metrics['throttles'] > 0:
+                    summary['functions_with_throttles'] += 1
 
         return results
 
@@ -265,35 +460,58 @@ class LambdaExecutionMonitor:
         Args:
             data (Dict): Dados das métricas coletadas
         """
-        # Limpar tela (funciona no Linux/Mac e Windows)
-        os.system(command='clear' if os.name == 'posix' else 'cls')
+        # Sem mudança nas métricas não há o que repintar; o timestamp fica
+        # fora da assinatura porque muda a cada tick
+        sig = hash(
+            json.dumps(
+                {
+                    name: {k: v for k, v in metrics.items() if k != 'timestamp'}
+                    for name, metrics in data['functions'].items()
+                },
+                sort_keys=True,
+                default=str,
+            )
+        )
+        if sig == self._last_display_sig:
+            return
+        self._last_display_sig = sig
+
+        # Monta o frame inteiro em memória e repinta com um único write:
+        # sequência ANSI de home+clear no lugar do fork/exec de /bin/clear
+        if sys.stdout.isatty():
+            sys.stdout.write('\x1b[H\x1b[2J')
+
+        out = []
 
         # Cabeçalho
-        print("=" * 100)
-        print("🚀 MONITOR DE EXECUÇÕES LAMBDA EM TEMPO REAL")
-        print("=" * 100)
-        print(f"🕐 Atualização: {datetime.now().strftime('%H:%M:%S')}")
-        print(f"📊 Período de métricas: {self.metric_period} minutos")
-        print(f"🔄 Próxima atualização em: {self.update_interval} segundos")
-        print()
+        out.append(_RULE_WIDE)
+        out.append("🚀 MONITOR DE EXECUÇÕES LAMBDA EM TEMPO REAL")
+        out.append(_RULE_WIDE)
+        out.append(f"🕐 Atualização: {datetime.now().strftime('%H:%M:%S')}")
+        out.append(f"📊 Período de métricas: {self.metric_period} minutos")
+        out.append(f"🔄 Próxima atualização em: {self.update_interval} segundos")
+        out.append("")
 
         # Resumo geral
         summary = data['summary']
-        print("📋 RESUMO GERAL:")
-        print(
+        out.append("📋 RESUMO GERAL:")
+        out.append(
             f"   • Funções ativas: {summary['active_functions']}/{data['total_functions']}"
         )
-        print(f"   • Executando agora: {summary['executing_functions']} ⚡")
-        print(f"   • Total invocações: {summary['total_invocations']}")
-        print(f"   • Total erros: {summary['total_errors']}")
-        print(f"   • Funções com erro: {summary['functions_with_errors']}")
-        print(f"   • Funções com throttle: {summary['functions_with_throttles']}")
-        print()
-
-        # Separar funções por status
-        executing_functions = []
-        active_functions = []
-        inactive_functions = []
+        out.append(f"   • Executando agora: {summary['executing_functions']} ⚡")
+        out.append(f"   • Total invocações: {summary['total_invocations']}")
+        out.append(f"   • Total erros: {summary['total_errors']}")
+        out.append(f"   • Funções com erro: {summary['functions_with_errors']}")
+        out.append(f"   • Funções com throttle: {summary['functions_with_throttles']}")
+        out.append("")
+
+        # Separar funções por status (listas reutilizadas entre ticks)
+        executing_functions = self._executing_list
+        active_functions = self._active_list
+        inactive_functions = self._inactive_list
+        executing_functions.clear()
+        active_functions.clear()
+        inactive_functions.clear()
 
         for func_name, metrics in data['functions'].items():
             if metrics['is_executing']:
@@ -305,57 +523,64 @@ class LambdaExecutionMonitor:
 
         # Mostrar funções executando
         if executing_functions:
-            print("⚡ EXECUTANDO AGORA:")
-            print("-" * 80)
+            out.append("⚡ EXECUTANDO AGORA:")
+            out.append(_RULE_NARROW)
             for func_name, metrics in executing_functions:
                 status_icon = self._get_status_icon(metrics)
                 concurrent = metrics['concurrent_executions']
                 duration = metrics['duration_avg']
 
-                print(f"{status_icon} {func_name}")
-                print(f"   🔥 Execuções simultâneas: {concurrent}")
-                print(f"   ⏱️  Duração média: {duration}ms")
-                print(
-                    f"   📈 Invocações: {metrics['invocations']} | Erros: {metrics['errors']}"
-                )
+                out.append(status_icon + ' ' + func_name)
+                out.append(_LINE_CONCURRENT + str(concurrent))
+                out.append(_LINE_DURATION + str(duration) + 'ms')
+                out.append(_FMT_INV_ERR(metrics['invocations'], metrics['errors']))
                 if metrics['success_rate'] > 0:
-                    print(f"   ✅ Taxa sucesso: {metrics['success_rate']}%")
-                print()
+                    out.append(_LINE_SUCCESS + str(metrics['success_rate']) + '%')
+                out.append("")
 
         # Mostrar funções ativas (mas não executando)
         if active_functions:
-            print("✅ ATIVAS (sem execução atual):")
-            print("-" * 80)
+            out.append("✅ ATIVAS (sem execução atual):")
+            out.append(_RULE_NARROW)
             for func_name, metrics in active_functions:
                 status_icon = self._get_status_icon(metrics)
 
-                print(f"{status_icon} {func_name}")
-                print(
-                    f"   📊 Invocações: {metrics['invocations']} | Erros: {metrics['errors']} | Throttles: {metrics['throttles']}"
+                out.append(status_icon + ' ' + func_name)
+                out.append(
+                    _FMT_INV_ERR_THR(
+                        metrics['invocations'],
+                        metrics['errors'],
+                        metrics['throttles'],
+                    )
                 )
                 if metrics['invocations'] > 0:
-                    print(
-                        f"   📈 Taxa sucesso: {metrics['success_rate']}% | Duração média: {metrics['duration_avg']}ms"
+                    out.append(
+                        _FMT_RATE_DUR(
+                            metrics['success_rate'], metrics['duration_avg']
+                        )
                     )
-                print()
+                out.append("")
 
         # Mostrar funções inativas ou com erro
         if inactive_functions:
-            print("⚠️  INATIVAS/ERRO:")
-            print("-" * 80)
+            out.append("⚠️  INATIVAS/ERRO:")
+            out.append(_RULE_NARROW)
             for func_name, metrics in inactive_functions:
                 status_icon = "❌" if metrics['status'] == 'not_found' else "🔧"
                 status_text = (
                     "Não encontrada" if metrics['status'] == 'not_found' else "Erro"
                 )
 
-                print(f"{status_icon} {func_name} - {status_text}")
+                out.append(f"{status_icon} {func_name} - {status_text}")
                 if 'error_message' in metrics:
-                    print(f"   ⚠️  {metrics['error_message']}")
-                print()
+                    out.append(f"   ⚠️  {metrics['error_message']}")
+                out.append("")
 
-        print("=" * 100)
-        print("Pressione Ctrl+C para sair")
+        out.append(_RULE_WIDE)
+        out.append("Pressione Ctrl+C para sair")
+
+        sys.stdout.write('\n'.join(out) + '\n')
+        sys.stdout.flush()
 
     def _get_status_icon(self, metrics: dict[str, Any]) -> str:
         """
@@ -390,8 +615,6 @@ class LambdaExecutionMonitor:
         if not save_to_log:
             return
 
-        log_file_path = os.getenv("LOG_FILE_PATH", "lambda_monitoring.log")
-
         try:
             # Preparar entrada de log
             log_entry = {
@@ -404,13 +627,57 @@ class LambdaExecutionMonitor:
                 ],
             }
 
-            # Adicionar ao arquivo de log
-            with open(log_file_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+            # Serialização em C quando orjson está disponível; o buffer de
+            # linha continua sendo do handle persistente
+            if orjson is not None:
+                line = orjson.dumps(log_entry).decode()
+            else:
+                line = json.dumps(log_entry, ensure_ascii=False)
+
+            # Adicionar ao arquivo de log (handle persistente entre ticks)
+            self._get_log_handle().write(line + '\n')
 
         except Exception as e:
             print(f"⚠️  Erro ao salvar log: {e}")
 
+    def _get_log_handle(self):
+        """
+        Retorna o handle do arquivo de log, aberto uma única vez
+
+        Line buffering garante uma linha completa por write sem pagar
+        open/close a cada tick; o fechamento fica registrado no atexit.
+
+        Returns:
+            Handle do arquivo de log em modo append
+        """
+        if self._log_fh is None:
+            log_file_path = os.getenv("LOG_FILE_PATH", "lambda_monitoring.log")
+            self._log_fh = open(log_file_path, 'a', encoding='utf-8', buffering=1)
+            atexit.register(self._log_fh.close)
+
+        return self._log_fh
+
+    def run_tick(self) -> dict[str, Any]:
+        """
+        Executa um ciclo completo de monitoramento: coleta, exibição e log
+
+        Returns:
+            Dict com as métricas coletadas no ciclo
+        """
+        # Coletar métricas
+        metrics_data = self.get_all_functions_metrics()
+
+        # Exibir no console
+        self.print_monitoring_display(metrics_data)
+
+        # Salvar log se configurado
+        self.save_monitoring_log(metrics_data)
+
+        # Publicar resumo no CloudWatch se configurado
+        self.publish_summary_metrics(metrics_data)
+
+        return metrics_data
+
     def start_monitoring(self) -> None:
         """
         Inicia o monitoramento contínuo das execuções Lambda
@@ -432,28 +699,149 @@ class LambdaExecutionMonitor:
         print(f"📋 Monitorando {len(functions)} funções: {', '.join(functions)}")
         print("Pressione Ctrl+C para sair\n")
 
-        try:
-            while True:
-                # Coletar métricas
-                metrics_data = self.get_all_functions_metrics()
-
-                # Exibir no console
-                self.print_monitoring_display(metrics_data)
+        # Ctrl+C apenas liga a flag; o loop encerra no próximo ponto de
+        # verificação e os recursos são liberados de forma limpa
+        self._stop = False
+        signal.signal(signal.SIGINT, lambda *_: setattr(self, '_stop', True))
 
-                # Salvar log se configurado
-                self.save_monitoring_log(metrics_data)
+        try:
+            # Agenda pelo relógio monotônico: o espaçamento real entre ticks
+            # fica igual ao intervalo, descontando a duração da coleta
+            next_tick = time.monotonic()
+            overruns = 0
+            while not self._stop:
+                self.run_tick()
 
                 # Aguardar próxima atualização
-                time.sleep(self.update_interval)
+                next_tick += self.update_interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    self._wait_for_tick(sleep_for)
+                    overruns = 0
+                else:
+                    overruns += 1
+                    if overruns >= 3:
+                        print(
+                            f"⚠️  Coleta levando mais que o intervalo de {self.update_interval}s"
+                        )
+                        # Reancora a agenda para não acumular atraso
+                        next_tick = time.monotonic()
+                        overruns = 0
+
+            print("\n\n👋 Monitor interrompido pelo usuário.")
+            print("✅ Sessão de monitoramento finalizada.")
+            self.close()
+            sys.exit(0)
 
         except KeyboardInterrupt:
             print("\n\n👋 Monitor interrompido pelo usuário.")
             print("✅ Sessão de monitoramento finalizada.")
+            self.close()
             sys.exit(0)
         except Exception as e:
             print(f"\n❌ Erro durante monitoramento: {str(e)}")
+            self.close()
             sys.exit(1)
 
+    def _wait_for_tick(self, sleep_for: float) -> None:
+        """
+        Espera até o próximo tick verificando a flag de parada
+
+        Em terminal interativo a espera usa select sobre o stdin, então
+        qualquer tecla (além do Ctrl+C) encerra o monitor imediatamente;
+        fora de TTY cai em time.sleep fatiado para reagir logo ao SIGINT.
+
+        Args:
+            sleep_for (float): Tempo total de espera em segundos
+        """
+        deadline = time.monotonic() + sleep_for
+        interactive = sys.stdin is not None and sys.stdin.isatty()
+
+        while not self._stop:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            if interactive:
+                ready, _, _ = select.select([sys.stdin], [], [], min(remaining, 0.5))
+                if ready:
+                    sys.stdin.readline()
+                    self._stop = True
+                    return
+            else:
+                time.sleep(min(remaining, 0.5))
+
+    def publish_summary_metrics(self, data: dict[str, Any]) -> None:
+        """
+        Publica o resumo do tick como métricas customizadas no CloudWatch
+
+        Habilitado por PUBLISH_SUMMARY_METRICS=true; é uma única chamada
+        put_metric_data por tick, no formato em lote e respeitando o limite
+        de 20 métricas por chamada.
+
+        Args:
+            data (Dict): Dados das métricas coletadas no tick
+        """
+        publish = os.getenv("PUBLISH_SUMMARY_METRICS", "false").lower() == "true"
+
+        if not publish:
+            return
+
+        metric_data = [
+            {'MetricName': name, 'Value': value, 'Unit': 'Count'}
+            for name, value in data['summary'].items()
+        ][:20]
+
+        try:
+            self.cloudwatch.put_metric_data(
+                Namespace='KuriLambdaMonitor', MetricData=metric_data
+            )
+        except Exception as e:
+            print(f"⚠️  Erro ao publicar métricas de resumo: {e}")
+
+    def _load_warm_cache(self) -> None:
+        """Recarrega as métricas persistidas por uma execução anterior"""
+        try:
+            with open(self._CACHE_FILE, 'rb') as f:
+                raw = f.read()
+            cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+            self.previous_metrics = cached.get('previous_metrics', {})
+            self._last_datapoint_ts = cached.get('last_datapoint_ts', {})
+            last_end = cached.get('last_fetch_end')
+            if last_end:
+                self._last_fetch_end = datetime.fromisoformat(last_end)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️  Cache de métricas ignorado: {e}")
+
+    def _save_warm_cache(self) -> None:
+        """Persiste as métricas atuais para o próximo reinício"""
+        payload = {
+            'previous_metrics': self.previous_metrics,
+            'last_datapoint_ts': self._last_datapoint_ts,
+            'last_fetch_end': (
+                self._last_fetch_end.isoformat() if self._last_fetch_end else None
+            ),
+        }
+
+        try:
+            if orjson is not None:
+                data = orjson.dumps(payload)
+            else:
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            with open(self._CACHE_FILE, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"⚠️  Erro ao salvar cache de métricas: {e}")
+
+    def close(self) -> None:
+        """Libera os recursos do monitor e persiste o cache quente"""
+        self._save_warm_cache()
+        if self._log_fh is not None and not self._log_fh.closed:
+            self._log_fh.close()
+
 
 def main():
     """Função principal com suporte a argumentos CLI"""
@@ -513,19 +901,17 @@ Exemplos de uso:
     args = parser.parse_args()
 
     try:
-        # Verificar credenciais AWS
-        session = boto3.Session()
-        credentials = session.get_credentials()
-        if not credentials:
-            print("❌ Credenciais AWS não encontradas.")
-            print("💡 Configure com: aws configure ou arquivo .env")
-            sys.exit(1)
-
         # Configurar parâmetros
         region = args.region or os.getenv("AWS_DEFAULT_REGION", "us-east-1")
 
-        # Inicializar monitor
+        # Inicializar monitor e verificar credenciais na mesma sessão,
+        # em vez de construir uma sessão descartável só para o check
         monitor = LambdaExecutionMonitor(region=region)
+        credentials = monitor.session.get_credentials()
+        if not credentials:
+            print("❌ Credenciais AWS não encontradas.")
+            print("💡 Configure com: aws configure ou arquivo .env")
+            sys.exit(1)
 
         # Aplicar configurações CLI
         if args.interval: